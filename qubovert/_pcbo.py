@@ -1777,6 +1777,58 @@ class PCBO(PUBO):
         P = 1 - OR(*variables)
         return self.add_constraint_eq_zero(P, lam=lam, bounds=(0, 1))
 
+    def add_constraint_OR_many(self, clauses, lam=1):
+        r"""add_constraint_OR_many.
+
+        Add the constraints ``add_constraint_OR(*clause, lam=lam)`` for each
+        ``clause`` in ``clauses``. The result is the same as calling
+        ``add_constraint_OR`` for each clause, but the penalties are all
+        added to the PCBO at once, and clauses of two variable labels are
+        built directly. Thus it is faster for many constraints.
+
+        Parameters
+        ----------
+        clauses : iterable of tuples.
+            Each element of each tuple is a hashable object or a dict (its
+            PUBO representation). They are the label of the boolean variables.
+            See ``help(PCBO.add_constraint_OR)``.
+        lam : float > 0 or sympy.Symbol (optional, defaults to 1).
+            Langrange multiplier to penalize violations of the clauses.
+
+        Return
+        ------
+        self : PCBO.
+            Updates the PCBO in place, but returns ``self`` so that operations
+            can be strung together.
+
+        Examples
+        --------
+        >>> H = PCBO()
+        >>> H.add_constraint_OR_many([('a', 'b'), ('b', 'c')])
+        >>> H == PCBO().add_constraint_OR('a', 'b').add_constraint_OR('b', 'c')
+        True
+
+        """
+        H = PUBO()
+        for clause in clauses:
+            if (
+                    len(clause) == 2 and
+                    not any(isinstance(x, dict) for x in clause)
+            ):
+                # 1 - OR(a, b) == 1 - a - b + a b. Use a list of pairs instead
+                # of a dict so that a == b is handled correctly.
+                a, b = clause
+                P = PUBO([((), 1), ((a,), -1), ((b,), -1), ((a, b), 1)])
+            else:
+                P = PUBO(1 - OR(*clause))
+            # the penalty for 1 - OR(...) == 0 is just lam * P, since
+            # 0 <= P <= 1. See add_constraint_OR and add_constraint_eq_zero.
+            self._append_constraint("eq", P)
+            H += P
+
+        self += lam * H
+        return self
+
     def add_constraint_XOR(self, *variables, lam=1):
         r"""add_constraint_XOR.
 
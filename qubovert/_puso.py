@@ -190,6 +190,7 @@ class PUSO(BO, PUSOMatrix):
         P = puso_to_pubo(self)
         P._mapping = self.mapping
         P._reverse_mapping = self.reverse_mapping
+        P._mapping_is_identity = self._mapping_is_identity
         return P
 
     def to_pubo(self, deg=None, lam=None, pairs=None):
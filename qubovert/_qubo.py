@@ -19,6 +19,7 @@ Contains the QUBO class. See ``help(qubovert.QUBO)``.
 """
 
 from .utils import BO, QUBOMatrix, PUBOMatrix, solution_type, spin_to_boolean
+import numpy as np
 
 
 __all__ = 'QUBO',
@@ -153,13 +154,63 @@ class QUBO(BO, QUBOMatrix):
 
         """
         Q = QUBOMatrix()
-
-        for k, v in self.items():
-            key = tuple(self._mapping[i] for i in k)
-            Q[key] += v
+        mapping, variables, degree = self._mapping, Q._variables, 0
+
+        if self._mapping_is_identity:
+            # the labels are already the integers that they map to, so the
+            # keys do not need to be relabeled at all.
+            dict.update(Q, self)
+            variables.update(*self)
+            degree = max(map(len, self), default=0)
+        elif len(set(mapping.values())) == len(mapping):
+            # the keys of self are already squashed and the mapping is one to
+            # one, so the mapped keys are distinct, valid QUBOMatrix keys once
+            # they are sorted. Thus we skip QUBOMatrix.__setitem__ and its key
+            # validation, and update the cached attributes ourselves.
+            for k, v in self.items():
+                if len(k) == 2:
+                    i, j = mapping[k[0]], mapping[k[1]]
+                    key = (i, j) if i < j else (j, i)
+                elif k:
+                    key = mapping[k[0]],
+                else:
+                    key = ()
+                dict.__setitem__(Q, key, v)
+                variables.update(key)
+                degree = max(degree, len(key))
+        else:
+            # multiple labels map to the same integer, so the mapped keys must
+            # be squashed and combined by QUBOMatrix.
+            for k, v in self.items():
+                Q[tuple(mapping[i] for i in k)] += v
+            return Q
+
+        Q._degree, Q._num_binary_variables = degree, len(variables)
 
         return Q
 
+    def to_qubo_coo(self):
+        """to_qubo_coo.
+
+        Create and return the upper triangular QUBO representing the problem
+        as three parallel numpy arrays in coordinate (COO) format. The labels
+        will be integers from 0 to n-1, the same as in ``to_qubo``. See
+        ``help(qubovert.utils.QUBOMatrix.to_qubo_coo)``.
+
+        Return
+        ------
+        res : tuple (rows, cols, vals) of numpy arrays.
+
+        Example
+        -------
+        >>> qubo = QUBO({('a',): 5, (0, 'a'): -2, (): -1.5})
+        >>> qubo.to_qubo_coo()
+        (array([0, 0], dtype=int32), array([0, 1], dtype=int32),
+         array([ 5., -2.]))
+
+        """
+        return QUBOMatrix.to_qubo_coo(self, self._mapping)
+
     def to_pubo(self):
         """to_pubo.
 
@@ -228,13 +279,18 @@ class QUBO(BO, QUBOMatrix):
         {'a': 1, 'b': 1, 'c': 0}
 
         """
-        sol_type = solution_type(solution, 'spin' if spin else 'bool')
-        if sol_type == 'spin':
+        if isinstance(solution, np.ndarray):
+            # find the solution type and the variables that are 1 with
+            # vectorized comparisons instead of looping over the array. If
+            # the array contains neither a 0 nor a -1, then it is all 1's and
+            # ``spin`` decides, as in ``solution_type``.
+            if (solution == -1).any() or (spin and not (solution == 0).any()):
+                solution = (solution == -1).astype(int).tolist()
+            else:
+                solution = (solution == 1).astype(int).tolist()
+        elif solution_type(solution, 'spin' if spin else 'bool') == 'spin':
             solution = spin_to_boolean(solution)
-        return {
-            self._reverse_mapping[i]: solution[i]
-            for i in range(self.num_binary_variables)
-        }
+        return {v: solution[i] for i, v in self._reverse_mapping.items()}
 
     @staticmethod
     def _check_key_valid(key):
@@ -257,7 +313,9 @@ class QUBO(BO, QUBOMatrix):
 
         """
         # override QUBOMatrix._check_key_valid to allow for noninteger keys.
-        if not isinstance(key, tuple) or len(set(key)) > 2:
+        # keys with at most two elements are always valid, so only build the
+        # set of unique elements for longer keys, eg ('a', 'b', 'a').
+        if not isinstance(key, tuple) or (len(key) > 2 and len(set(key)) > 2):
             raise KeyError(
                 "Key formatted incorrectly, must be tuple of <= 2 unique "
                 "elements. See PUBO for arbitrary numbers of unique elements.")
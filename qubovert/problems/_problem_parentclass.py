@@ -19,12 +19,67 @@ the problem classes.
 
 """
 
-from qubovert.utils import Conversions, PUBOMatrix
+from qubovert.utils import Conversions, PUBOMatrix, QUBOMatrix
+from qubovert.utils._solve_bruteforce import (
+    _solve_qubo_bruteforce_arrays, _best_qubo_candidates
+)
+from functools import wraps
+import numpy as np
 
 
 __all__ = 'Problem',
 
 
+# the maximum number of models that ``_cache_model`` stores on each instance.
+_CACHE_SIZE = 8
+
+
+def _cache_model(method):
+    """_cache_model.
+
+    Cache the output of a ``to_qubo`` or ``to_quso`` method of a ``Problem``
+    subclass on the instance, keyed by the arguments it was called with. A
+    copy of the cached model is returned so that the cache cannot be modified
+    by the caller. The types of the arguments are part of the key, so that
+    for example ``A=1`` and ``A=1.0`` are cached separately. At most
+    ``_CACHE_SIZE`` models are stored, after which the oldest one is dropped.
+    If the arguments are not hashable, then nothing is cached.
+
+    The cache is only valid if the model depends on nothing but the
+    arguments and the (immutable) input of the problem, so only decorate
+    methods for which this is true.
+
+    Parameters
+    ----------
+    method : function.
+        The ``to_qubo`` or ``to_quso`` method to decorate.
+
+    Return
+    ------
+    wrapper : function.
+
+    """
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        key = (
+            method.__qualname__,
+            tuple((type(a), a) for a in args),
+            tuple((k, type(v), v) for k, v in sorted(kwargs.items()))
+        )
+        try:
+            model = self._cache.get(key)
+        except TypeError:  # unhashable arguments
+            return method(self, *args, **kwargs)
+        if model is None:
+            model = method(self, *args, **kwargs)
+            if len(self._cache) >= _CACHE_SIZE:
+                del self._cache[next(iter(self._cache))]
+            self._cache[key] = model
+        return model.copy()
+
+    return wrapper
+
+
 class Problem(Conversions):
     """Problem.
 
@@ -44,6 +99,8 @@ class Problem(Conversions):
     ``help(qubovert.utils.Conversions)``
     """
 
+    __slots__ = '_problem_args', '_problem_kwargs', '_cache'
+
     def __new__(cls, *args, **kwargs):
         """__new__.
 
@@ -66,8 +123,45 @@ class Problem(Conversions):
         """
         obj = super().__new__(cls)
         obj._problem_args, obj._problem_kwargs = args, kwargs.copy()
+        obj._cache = {}
         return obj
 
+    def __getstate__(self):
+        """__getstate__.
+
+        Return the state of the problem for pickling. The cached models are
+        derived from the rest of the state, so they are left out. See
+        ``help(Problem.__setstate__)``.
+
+        Return
+        ------
+        state : dict.
+            Maps each attribute name to its value.
+
+        """
+        state = dict(getattr(self, '__dict__', {}))
+        for cls in type(self).__mro__:
+            for name in cls.__dict__.get('__slots__', ()):
+                if name != '_cache' and hasattr(self, name):
+                    state[name] = getattr(self, name)
+        return state
+
+    def __setstate__(self, state):
+        """__setstate__.
+
+        Restore the state of the problem after unpickling, starting with an
+        empty cache. See ``help(Problem.__getstate__)``.
+
+        Parameters
+        ----------
+        state : dict.
+            The output of ``__getstate__``.
+
+        """
+        for name, value in state.items():
+            setattr(self, name, value)
+        self._cache = {}
+
     @property
     def num_binary_variables(self):
         """num_binary_variables.
@@ -113,16 +207,9 @@ class Problem(Conversions):
         s : str.
 
         """
-        s = self.__class__.__name__ + "("
-        if not self._problem_args and not self._problem_kwargs:
-            return s + ")"
-        for a in self._problem_args:
-            val = str(a) if not isinstance(a, str) else "'%s'" % a
-            s += val + ", "
-        for k, v in self._problem_kwargs.items():
-            val = str(v) if not isinstance(v, str) else "'%s'" % v
-            s += str(k) + "=" + val + ", "
-        return s[:-2] + ")"
+        args = [repr(a) for a in self._problem_args]
+        args.extend("%s=%r" % x for x in self._problem_kwargs.items())
+        return "%s(%s)" % (self.__class__.__name__, ", ".join(args))
 
     def __eq__(self, other):
         """__eq__.
@@ -140,7 +227,7 @@ class Problem(Conversions):
 
         """
         return (
-            isinstance(other, type(self)) and
+            type(other) is type(self) and
             self._problem_args == other._problem_args and
             self._problem_kwargs == other._problem_kwargs
         )
@@ -219,9 +306,13 @@ class Problem(Conversions):
         QUBO/QUSO formulations. If this is the case, then the child class
         for this problem should override this method with a better bruteforce
         solver. But, for problems that do not use slack variables, this
-        method will suffice. It converts the problem to QUBO, solves it with
-        ``qubovert.utils.solve_qubo_bruteforce``, and then calls and returns
-        ``convert_solution``.
+        method will suffice. It converts the problem to QUBO, solves it
+        bruteforce, and then calls and returns ``convert_solution``. If
+        ``to_qubo`` returns a ``qubovert.utils.QUBOMatrix`` with finite
+        coefficients, then many bitstrings are evaluated at once with numpy,
+        otherwise the model's own ``solve_bruteforce`` method is used. The
+        solutions are the same as those of
+        ``qubovert.utils.solve_qubo_bruteforce``.
 
         Parameters
         ----------
@@ -244,7 +335,39 @@ class Problem(Conversions):
         kwargs = kwargs.copy()
         all_solutions = kwargs.pop("all_solutions", False)
         qubo = self.to_qubo(*args, **kwargs)
-        sol = qubo.solve_bruteforce(all_solutions)
+        if type(qubo) is not QUBOMatrix:
+            # the vectorized solver below needs a QUBOMatrix, ie integer
+            # labels, so use the model's own bruteforce solver otherwise.
+            sol = qubo.solve_bruteforce(all_solutions)
+            if all_solutions:
+                return [self.convert_solution(x) for x in sol]
+            return self.convert_solution(sol)
+
+        # put the QUBO in coordinate form so that we can evaluate many
+        # bitstrings at once with numpy. The labels of the QUBO are not
+        # necessarily 0 through N-1, so map them to 0 through N-1 in the same
+        # order that ``qubovert.utils.solve_qubo_bruteforce`` enumerates them.
+        var = set()
+        for x in qubo:
+            var.update(set(x))
+        variables = list(var)
+        rows, cols, vals = qubo.to_qubo_coo(
+            {v: i for i, v in enumerate(variables)}
+        )
+
+        offset = qubo.offset
+        if not (np.isfinite(vals).all() and np.isfinite(offset)):
+            # numpy would evaluate 0 * inf to nan, so let the model's own
+            # bruteforce solver handle infinite coefficients.
+            sol = qubo.solve_bruteforce(all_solutions)
+        else:
+            candidates = _solve_qubo_bruteforce_arrays(
+                rows, cols, vals, len(variables), offset
+            )
+            sol = _best_qubo_candidates(
+                qubo, candidates.tolist(), variables, all_solutions
+            )
+
         if all_solutions:
             return [self.convert_solution(x) for x in sol]
         return self.convert_solution(sol)
@@ -20,6 +20,7 @@ Contains the AlternatingSectorsChain class. See
 
 from qubovert.utils import QUSOMatrix, boolean_to_spin, solution_type
 from qubovert.problems import Problem
+from qubovert.problems._problem_parentclass import _cache_model
 
 
 __all__ = 'AlternatingSectorsChain',
@@ -58,6 +59,8 @@ class AlternatingSectorsChain(Problem):
 
     """
 
+    __slots__ = '_N', '_chain_length', '_min_strength', '_max_strength'
+
     def __init__(self, num_binary_variables,
                  chain_length=3, min_strength=1, max_strength=10):
         """__init__.
@@ -113,6 +116,7 @@ class AlternatingSectorsChain(Problem):
         """
         return self._N
 
+    @_cache_model
     def to_quso(self, pbc=False):
         r"""to_quso.
 
@@ -20,6 +20,7 @@ Contains the BILP class. See ``help(qubovert.problems.BILP)``.
 
 from qubovert.utils import QUBOMatrix, solution_type, spin_to_boolean
 from qubovert.problems import Problem
+from qubovert.problems._problem_parentclass import _cache_model
 import numpy as np
 
 
@@ -67,6 +68,8 @@ class BILP(Problem):
 
     """
 
+    __slots__ = '_c', '_S', '_b', '_m', '_N'
+
     def __init__(self, c, S, b):
         r"""__init__.
 
@@ -161,6 +164,7 @@ class BILP(Problem):
         """
         return self._N
 
+    @_cache_model
     def to_qubo(self, A=None, B=1):
         r"""to_qubo.
 
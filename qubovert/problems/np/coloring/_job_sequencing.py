@@ -24,6 +24,7 @@ from qubovert.utils import (
     QUBOMatrix, decimal_to_boolean, solution_type, spin_to_boolean
 )
 from qubovert.problems import Problem
+from qubovert.problems._problem_parentclass import _cache_model
 
 
 __all__ = 'JobSequencing',
@@ -71,6 +72,11 @@ class JobSequencing(Problem):
 
     """
 
+    __slots__ = (
+        '_input_type', '_lengths', '_job_to_int', '_m', '_M', '_N', '_max_L',
+        '_log_trick', '_log_M'
+    )
+
     def __init__(self, job_lengths, num_workers, log_trick=True, M=None):
         """__init__.
 
@@ -244,6 +250,7 @@ class JobSequencing(Problem):
         # all the minuses are because we don't need a y(i, 0)!
         return self._N * self._m + i * (self._m - 1) + worker - 1
 
+    @_cache_model
     def to_qubo(self, A=None, B=1):
         r"""to_qubo.
 
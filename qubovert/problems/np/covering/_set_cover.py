@@ -23,6 +23,7 @@ from qubovert.utils import (
     QUBOMatrix, solve_qubo_bruteforce, solution_type, spin_to_boolean
 )
 from qubovert.problems import Problem
+from qubovert.problems._problem_parentclass import _cache_model
 
 
 __all__ = 'SetCover',
@@ -66,6 +67,11 @@ class SetCover(Problem):
 
     """
 
+    __slots__ = (
+        '_U', '_V', '_weights', '_alpha_to_index', '_log_trick', '_log_M',
+        '_M', '_N', '_n'
+    )
+
     def __init__(self, U, V, weights=None, log_trick=True, M=None):
         """__init__.
 
@@ -282,6 +288,7 @@ class SetCover(Problem):
         mm = m if self._log_trick else m-1
         return self._N + self._alpha_to_index[alpha] + self._n*mm
 
+    @_cache_model
     def to_qubo(self, A=2, B=1):
         r"""to_qubo.
 
@@ -20,6 +20,7 @@ Contains the VertexCover class. See ``help(qubovert.problems.VertexCover)``.
 
 from qubovert import PCBO
 from qubovert.problems import Problem
+from qubovert.problems._problem_parentclass import _cache_model
 from qubovert.utils import (
     solution_type, spin_to_boolean, QUBOMatrix, hash_function
 )
@@ -65,6 +66,11 @@ class VertexCover(Problem):
 
     """
 
+    __slots__ = (
+        '_edges', '_edge_sets', '_vertices', '_vertex_to_index',
+        '_index_to_vertex', '_edge_indices', '_N', '_n'
+    )
+
     def __init__(self, edges):
         """__init__.
 
@@ -87,47 +93,50 @@ class VertexCover(Problem):
         >>> problem = VertexCover(edges)
 
         """
-        self._edges = edges.copy()
-        self._vertices = {y for x in edges for y in x}
-        self._vertex_to_index = {
-            x: i
-            for i, x in enumerate(sorted(self._vertices, key=hash_function))
-        }
-        self._index_to_vertex = {
-            i: x for x, i in self._vertex_to_index.items()
-        }
+        self._edges = frozenset(edges)
+        # used in is_solution_valid to check each edge with set.isdisjoint.
+        self._edge_sets = tuple(frozenset(e) for e in self._edges)
+        self._vertices = frozenset().union(*self._edges)
+        order = sorted(self._vertices, key=hash_function)
+        self._vertex_to_index = {x: i for i, x in enumerate(order)}
+        self._index_to_vertex = dict(enumerate(order))
+        # the edges in terms of the vertex indices, used in to_qubo.
+        self._edge_indices = tuple(
+            (self._vertex_to_index[u], self._vertex_to_index[v])
+            for u, v in self._edges
+        )
         self._N, self._n = len(self._vertices), len(self._edges)
 
     @property
     def E(self):
         """E.
 
-        A copy of the set of edges of the graph. Updating the copy will not
-        update the instance set.
+        The set of edges of the graph. It is a frozenset, so it is returned
+        without being copied. Use ``set(problem.E)`` for a mutable copy.
 
         Return
         ------
-        E : set of two element tuples.
-            A copy of the edge set defining the Vertex Cover problem.
+        E : frozenset of two element tuples.
+            The edge set defining the Vertex Cover problem.
 
         """
-        return self._edges.copy()
+        return self._edges
 
     @property
     def V(self):
         """V.
 
-        A copy of the vertex set of the graph. Updating the copy will not
-        update the instance set.
+        The vertex set of the graph. It is a frozenset, so it is returned
+        without being copied. Use ``set(problem.V)`` for a mutable copy.
 
         Return
         ------
-        V : set.
-            A copy of the set of vertices corresponding to the edge set for the
-            Vertex Cover problem.
+        V : frozenset.
+            The set of vertices corresponding to the edge set for the Vertex
+            Cover problem.
 
         """
-        return self._vertices.copy()
+        return self._vertices
 
     @property
     def num_binary_variables(self):
@@ -143,6 +152,7 @@ class VertexCover(Problem):
         """
         return self._N
 
+    @_cache_model
     def to_qubo(self, A=2, B=1):
         r"""to_qubo.
 
@@ -181,14 +191,12 @@ class VertexCover(Problem):
 
         Q = QUBOMatrix()
 
-        # encode H_B (equation 34)
-        for i in range(self._N):
-            Q[(i,)] += B
+        # encode H_B (equation 34). Q is empty, so we can set the terms with
+        # one update instead of looking up and adding to each one.
+        Q.update({(i,): B for i in range(self._N)})
 
         # encode H_A, ie each edge is adjacent to at least one colored vertex.
-        for u, v in self._edges:
-            iu, iv = self._vertex_to_index[u], self._vertex_to_index[v]
-            Q += PCBO().add_constraint_OR(iu, iv, lam=A)
+        Q += PCBO().add_constraint_OR_many(self._edge_indices, lam=A)
 
         return Q
 
@@ -279,4 +287,4 @@ class VertexCover(Problem):
         if not isinstance(solution, set):
             solution = self.convert_solution(solution, spin)
 
-        return all(i in solution or j in solution for i, j in self._edges)
+        return not any(map(solution.isdisjoint, self._edge_sets))
@@ -22,6 +22,7 @@ See ``help(qubovert.problems.GraphPartitioning)``.
 from qubovert.utils import QUSOMatrix
 from qubovert import PCSO
 from qubovert.problems import Problem
+from qubovert.problems._problem_parentclass import _cache_model
 
 
 __all__ = 'GraphPartitioning',
@@ -70,6 +71,11 @@ class GraphPartitioning(Problem):
 
     """
 
+    __slots__ = (
+        '_edges', '_vertices', '_vertex_to_index', '_index_to_vertex', '_N',
+        '_degree'
+    )
+
     def __init__(self, edges):
         """__init__.
 
@@ -195,6 +201,7 @@ class GraphPartitioning(Problem):
         """
         return self._N
 
+    @_cache_model
     def to_quso(self, A=None, B=1):
         r"""to_quso.
 
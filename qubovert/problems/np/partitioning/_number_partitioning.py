@@ -21,6 +21,7 @@ Contains the NumberPartitioning class. See
 
 from qubovert.utils import QUSOMatrix
 from qubovert.problems import Problem
+from qubovert.problems._problem_parentclass import _cache_model
 
 
 __all__ = 'NumberPartitioning',
@@ -70,6 +71,8 @@ class NumberPartitioning(Problem):
 
     """
 
+    __slots__ = '_input_type', '_S', '_N'
+
     def __init__(self, S):
         """__init__.
 
@@ -132,6 +135,7 @@ class NumberPartitioning(Problem):
         """
         return self._N
 
+    @_cache_model
     def to_quso(self, A=1):
         r"""to_quso.
 
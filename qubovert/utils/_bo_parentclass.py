@@ -53,6 +53,9 @@ class BO(Conversions):
 
         """
         self._mapping, self._reverse_mapping, self._next_label = {}, {}, 0
+        # whether every label is an int that is mapped to itself. Used to skip
+        # relabeling in subclasses' ``to_qubo`` methods.
+        self._mapping_is_identity = True
 
     @property
     def mapping(self):
@@ -190,6 +193,7 @@ class BO(Conversions):
         for k, v in _generate_key_value_pairs(*args, **kwargs):
             self._mapping[k] = v
             self._reverse_mapping[v] = k
+        self._update_mapping_is_identity()
 
     def set_reverse_mapping(self, *args, **kwargs):
         """set_reverse_mapping.
@@ -214,6 +218,19 @@ class BO(Conversions):
         for k, v in _generate_key_value_pairs(*args, **kwargs):
             self._mapping[v] = k
             self._reverse_mapping[k] = v
+        self._update_mapping_is_identity()
+
+    def _update_mapping_is_identity(self):
+        """_update_mapping_is_identity.
+
+        Internal method to recompute whether the mapping maps every label to
+        itself, ie whether every label is an integer from 0 to n-1 and is
+        mapped to that same integer.
+
+        """
+        self._mapping_is_identity = all(
+            type(k) is int and k == v for k, v in self._mapping.items()
+        )
 
     def __setitem__(self, key, value):
         """__setitem__.
@@ -234,6 +251,10 @@ class BO(Conversions):
 
         for i in key:
             if i not in self._mapping:
+                self._mapping_is_identity = (
+                    self._mapping_is_identity and
+                    type(i) is int and i == self._next_label
+                )
                 self._mapping[i] = self._next_label
                 self._reverse_mapping[self._next_label] = i
                 self._next_label += 1
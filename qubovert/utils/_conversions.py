@@ -320,6 +320,8 @@ class Conversions:
 
     """
 
+    __slots__ = ()
+
     def to_qubo(self, *args, **kwargs):
         """to_qubo.
 
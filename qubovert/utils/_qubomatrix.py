@@ -168,6 +168,74 @@ class QUBOMatrix(PUBOMatrix):
         """
         return {k * (3 - len(k)): v for k, v in self.items() if k}
 
+    def to_qubo_coo(self, mapping=None):
+        r"""to_qubo_coo.
+
+        Return the QUBO as three parallel numpy arrays in coordinate (COO)
+        format. Linear terms are placed on the diagonal, and the offset (ie
+        the value corresponding to the key ``()``) is ignored. See the
+        ``offset`` property to access it.
+
+        The arrays can be passed straight to ``scipy.sparse.coo_matrix``, or
+        to any other code that works with arrays instead of dictionaries.
+
+        Parameters
+        ----------
+        mapping : dict (optional, defaults to None).
+            Maps each label of the QUBO to the integer index that is used in
+            ``rows`` and ``cols``. If ``mapping`` is None, then the labels
+            themselves are used. ``qubovert.QUBO.to_qubo_coo`` passes its
+            mapping here.
+
+        Return
+        ------
+        res : tuple (rows, cols, vals).
+            ``rows`` and ``cols`` are ``numpy.int32`` arrays and ``vals`` is
+            a ``numpy.float64`` array, such that the QUBO (without its offset)
+            is :math:`\sum_k v_k x_{r_k} x_{c_k}`, where ``v = vals``,
+            ``r = rows``, and ``c = cols``. Note that ``rows[k] <= cols[k]``.
+
+        Raises
+        ------
+        TypeError if a coefficient cannot be converted to a float, for example
+        if it contains a ``sympy`` symbol. Use ``subs`` to replace any symbols
+        with values first.
+
+        Example
+        -------
+        >>> Q = QUBOMatrix({(0,): 5, (0, 1): -2, (): -1.5})
+        >>> Q.to_qubo_coo()
+        (array([0, 0], dtype=int32), array([0, 1], dtype=int32),
+         array([ 5., -2.]))
+
+        """
+        n = len(self) - (() in self)
+        rows = np.empty(n, dtype=np.int32)
+        cols = np.empty(n, dtype=np.int32)
+        vals = np.empty(n, dtype=np.float64)
+
+        k = 0
+        for key, v in self.items():
+            if key:
+                # the keys are already sorted, so key[0] <= key[-1] unless
+                # they are relabeled.
+                i, j = key[0], key[-1]
+                if mapping is not None:
+                    i, j = mapping[i], mapping[j]
+                    if i > j:
+                        i, j = j, i
+                rows[k], cols[k] = i, j
+                try:
+                    vals[k] = v
+                except TypeError:
+                    raise TypeError(
+                        "Cannot convert the coefficient %s of %s to a float. "
+                        "Use subs to replace any symbols with values "
+                        "first." % (v, key))
+                k += 1
+
+        return rows, cols, vals
+
 
 def matrix_to_qubo(matrix):
     r"""matrix_to_qubo.
@@ -19,6 +19,9 @@ as QUBO/PUBO and PUSO objective function evaluators.
 
 """
 
+import numpy as np
+
+
 __all__ = (
     'boolean_to_spin', 'spin_to_boolean',
     'decimal_to_spin', 'spin_to_decimal',
@@ -427,6 +430,134 @@ def _solve_bruteforce(D, all_solutions, valid, spin):
     return best
 
 
+def _solve_qubo_bruteforce_arrays(rows, cols, vals, num_vars, offset=0):
+    """_solve_qubo_bruteforce_arrays.
+
+    Helper function for ``qubovert.problems.Problem.solve_bruteforce``.
+
+    Bruteforce search a QUBO given in coordinate form, evaluating the
+    objective function for blocks of bitstrings at once with numpy instead of
+    one bitstring at a time. The bitstrings are enumerated in the same order
+    as in ``_solve_bruteforce``, ie the bitstring for the integer ``n`` is
+    ``decimal_to_boolean(n, num_vars)``. Do not use for large problem sizes!
+
+    numpy sums the terms in a different order than ``pubo_value``, so with
+    float coefficients the two can round degenerate values differently.
+    Therefore this does not decide the best bitstrings itself. Instead it
+    returns every bitstring whose numpy value is within ``atol`` of the
+    numpy minimum, where
+
+        ``atol = 4 * m * eps * (sum(abs(vals)) + abs(offset))``,
+
+    ``m = len(vals) + 2 * num_vars + 1`` and ``eps`` is the machine epsilon.
+    Both the numpy value and the ``pubo_value`` of a bitstring differ from
+    its exact value by at most a quarter of ``atol``, so the candidates
+    contain every bitstring that ``pubo_value`` evaluates to its minimum. The
+    caller should evaluate the candidates with ``pubo_value`` to pick the
+    best ones.
+
+    Parameters
+    ----------
+    rows : numpy array of ints.
+        ``rows[k]`` is the index of the first variable of term ``k``.
+    cols : numpy array of ints.
+        ``cols[k]`` is the index of the second variable of term ``k``. It is
+        equal to ``rows[k]`` for linear terms.
+    vals : numpy array of floats.
+        ``vals[k]`` is the coefficient of term ``k``.
+    num_vars : int.
+        The number of variables. Each element of ``rows`` and ``cols`` must be
+        in ``range(num_vars)``.
+    offset : float (optional, defaults to 0).
+        The offset of the QUBO. It is not added to the values, but the
+        rounding error of adding it is included in ``atol``.
+
+    Returns
+    -------
+    candidates : numpy array of ints.
+        The integers ``n``, in increasing order, whose bitstrings give a value
+        within ``atol`` of the minimum of the QUBO.
+
+    """
+    U = np.zeros((num_vars, num_vars))
+    np.add.at(U, (rows, cols), vals)
+    shifts = np.arange(num_vars - 1, -1, -1)
+
+    atol = (
+        4 * (len(vals) + 2 * num_vars + 1) * np.finfo(float).eps *
+        (np.abs(vals).sum() + abs(offset))
+    )
+
+    best = np.inf
+    candidates = np.empty(0, dtype=int)
+    candidate_values = np.empty(0)
+    block = 1 << min(num_vars, 14)
+    for start in range(0, 1 << num_vars, block):
+        n = np.arange(start, start + block)
+        x = ((n[:, None] >> shifts) & 1).astype(float)
+        values = ((x @ U) * x).sum(axis=1)
+        best = min(best, values.min())
+        close = values <= best + atol
+        candidates = np.concatenate((candidates, n[close]))
+        candidate_values = np.concatenate((candidate_values, values[close]))
+        # drop the old candidates that are no longer close to the best value.
+        close = candidate_values <= best + atol
+        candidates = candidates[close]
+        candidate_values = candidate_values[close]
+
+    return candidates
+
+
+def _best_qubo_candidates(Q, candidates, variables, all_solutions=False):
+    """_best_qubo_candidates.
+
+    Helper function for ``qubovert.problems.Problem.solve_bruteforce``.
+
+    Evaluate the candidates returned by ``_solve_qubo_bruteforce_arrays`` with
+    ``pubo_value`` in exactly the same way as ``_solve_bruteforce``, and pick
+    the best ones.
+
+    Parameters
+    ----------
+    Q : dict or qubovert.utils.QUBOMatrix object.
+        Maps tuples of boolean variables indices to the Q value.
+    candidates : iterable of ints.
+        The integers ``n``, in increasing order, whose bitstrings should be
+        evaluated. As in ``_solve_qubo_bruteforce_arrays``, the bitstring for
+        ``n`` is ``decimal_to_boolean(n, len(variables))``.
+    variables : list.
+        ``variables[i]`` is the label of the variable corresponding to bit
+        ``i`` of each bitstring.
+    all_solutions : boolean (optional, defaults to False).
+        Whether or not to return all the best solutions.
+
+    Returns
+    -------
+    res : dict or list of dicts.
+        If ``all_solutions`` is False, then ``res`` is one of the best
+        solutions, otherwise it is a list of all the best solutions in the
+        order that ``_solve_bruteforce`` finds them.
+
+    """
+    # ``_solve_bruteforce`` moves the offset to the end of the dictionary, so
+    # that it is added last.
+    Q = dict(Q)
+    if () in Q:
+        Q[()] = Q.pop(())
+
+    N = len(variables)
+    best, sol = None, []
+    for n in candidates:
+        x = {v: (n >> (N - 1 - i)) & 1 for i, v in enumerate(variables)}
+        v = pubo_value(x, Q)
+        if best is None or v < best:
+            best, sol = v, [x]
+        elif v == best and all_solutions:
+            sol.append(x)
+
+    return sol if all_solutions else sol[0]
+
+
 def solve_pubo_bruteforce(P, all_solutions=False, valid=lambda x: True):
     """solve_pubo_bruteforce.
 
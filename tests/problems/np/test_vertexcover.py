@@ -36,7 +36,10 @@ def test_vertexcover_str():
 def test_properties():
 
     assert problem.E == edges
-    problem.V
+    assert problem.V == {"a", "b", "c", "d", "e"}
+    assert isinstance(problem.E, frozenset)
+    assert isinstance(problem.V, frozenset)
+    assert not hasattr(problem, '__dict__')
 
 
 def test_vertexcover_bruteforce():
@@ -16,9 +16,168 @@
 Contains tests for the ProblemParent class.
 """
 
-from qubovert.problems import Problem
+from pickle import dumps, loads
+from qubovert.problems import Problem, VertexCover, NumberPartitioning
+from qubovert.problems._problem_parentclass import _cache_model, _CACHE_SIZE
+from qubovert import QUBO, PCBO
+from qubovert.utils import QUBOMatrix, solve_qubo_bruteforce
 
 
 def test_problem():
 
     assert str(Problem()) == "Problem()"
+    assert str(Problem(1, 'a', b="it's")) == 'Problem(1, \'a\', b="it\'s")'
+
+
+def test_problem_cache():
+
+    class CountingProblem(Problem):
+
+        calls = 0
+
+        @_cache_model
+        def to_qubo(self, A=1, unused=None):
+            CountingProblem.calls += 1
+            return QUBOMatrix({(0,): A, (0, 1): -A})
+
+    problem = CountingProblem()
+    Q = problem.to_qubo()
+    assert Q == {(0,): 1, (0, 1): -1}
+    assert CountingProblem.calls == 1
+
+    # the cached model is returned as a copy
+    Q[(0,)] += 5
+    assert problem.to_qubo() == {(0,): 1, (0, 1): -1}
+    assert CountingProblem.calls == 1
+
+    assert problem.to_qubo(2) == {(0,): 2, (0, 1): -2}
+    assert CountingProblem.calls == 2
+    assert problem.to_qubo(A=2) == {(0,): 2, (0, 1): -2}
+    assert CountingProblem.calls == 3
+    problem.to_quso(A=2)
+    assert CountingProblem.calls == 3
+
+    # unhashable arguments are not cached
+    problem.to_qubo(unused={})
+    problem.to_qubo(unused={})
+    assert CountingProblem.calls == 5
+
+    # the types of the arguments are part of the key
+    assert type(problem.to_qubo(1.)[(0,)]) is float
+    assert CountingProblem.calls == 6
+    problem.to_qubo(True)
+    assert CountingProblem.calls == 7
+
+    # the size of the cache is limited
+    for A in range(3, 3 + 2 * _CACHE_SIZE):
+        problem.to_qubo(A)
+    assert len(problem._cache) == _CACHE_SIZE
+
+    # subclasses are only cached if they opt in
+    class UncachedProblem(Problem):
+
+        calls = 0
+
+        def to_qubo(self):
+            UncachedProblem.calls += 1
+            return QUBOMatrix({(0,): UncachedProblem.calls})
+
+    problem = UncachedProblem()
+    assert problem.to_qubo() == {(0,): 1}
+    assert problem.to_qubo() == {(0,): 2}
+
+
+def test_problem_pickle():
+
+    for problem, method in (
+        (VertexCover({(0, 1), (1, 2)}), 'to_qubo'),
+        (NumberPartitioning([1, 2, 3]), 'to_quso')
+    ):
+        model = getattr(problem, method)()
+        problem.solve_bruteforce()
+        assert problem._cache
+        new_problem = loads(dumps(problem))
+        assert new_problem == problem
+        assert not new_problem._cache
+        assert getattr(new_problem, method)() == model
+        assert new_problem.num_binary_variables == 3
+
+
+def test_problem_solve_bruteforce():
+
+    class QUBOProblem(Problem):
+
+        def to_qubo(self):
+            return QUBOMatrix(self._problem_args[0])
+
+        def convert_solution(self, solution):
+            return solution
+
+    Q = {(0, 1): 1, (1, 2): 1, (1,): -1, (2,): -2, (): 3}
+    problem = QUBOProblem(Q)
+    assert problem.solve_bruteforce() == solve_qubo_bruteforce(Q)[1]
+    assert (
+        problem.solve_bruteforce(all_solutions=True) ==
+        solve_qubo_bruteforce(Q, True)[1]
+    )
+
+    # degenerate solutions are all returned
+    Q = {(0,): 1, (1,): -1, (2,): -1, (1, 2): 1}
+    problem = QUBOProblem(Q)
+    assert problem.solve_bruteforce(all_solutions=True) == [
+        {0: 0, 1: 0, 2: 1}, {0: 0, 1: 1, 2: 0}, {0: 0, 1: 1, 2: 1}
+    ]
+
+    # float coefficients that round differently for degenerate solutions
+    for Q in (
+        {(1,): .3, (1, 3): .1, (1, 4): -.3, (2,): -2, (2, 4): .1, (3,): .3,
+         (4,): -2},
+        {(0,): .1, (2,): -.3, (0, 2): -.1, (1, 2): .7},
+        {(0,): -.1, (1,): -.3, (0, 1): .1, (): .1},
+        {(1,): 1e16, (0,): .1, (0, 1): -1e16},
+        {(0,): 3e15, (0, 1): -7e15, (1,): 1e16, (2,): -.1, (): .3},
+        {(0,): float("inf"), (1,): -1},
+        {(0,): -1, (1,): -1, (): float("inf")}
+    ):
+        problem = QUBOProblem(Q)
+        assert problem.solve_bruteforce() == solve_qubo_bruteforce(Q)[1]
+        assert (
+            problem.solve_bruteforce(all_solutions=True) ==
+            solve_qubo_bruteforce(Q, True)[1]
+        )
+
+    # the labels do not have to be consecutive
+    Q = {(0, 3): 1, (3,): -1, (7,): -1}
+    assert QUBOProblem(Q).solve_bruteforce() == {0: 0, 3: 1, 7: 1}
+    Q = {(8,): -1, (1,): -1, (1, 8): 1}
+    problem = QUBOProblem(Q)
+    assert problem.solve_bruteforce() == solve_qubo_bruteforce(Q)[1]
+    assert (
+        problem.solve_bruteforce(all_solutions=True) ==
+        solve_qubo_bruteforce(Q, True)[1]
+    )
+
+    # other types of models are solved with their own solve_bruteforce
+    class ModelProblem(Problem):
+
+        def to_qubo(self):
+            return self._problem_args[0]
+
+        def convert_solution(self, solution):
+            return solution
+
+    model = QUBO({(1,): 1, (0,): -1})
+    assert list(model.mapping.items()) == [(1, 0), (0, 1)]
+    assert ModelProblem(model).solve_bruteforce() == {0: 1, 1: 0}
+    assert ModelProblem(model).solve_bruteforce(all_solutions=True) == [
+        {0: 1, 1: 0}
+    ]
+
+    model = PCBO({('a',): -1, ('b',): -1}).add_constraint_OR('a', 'b', lam=5)
+    model.add_constraint_eq_zero({('a',): 1, ('b',): 1, (): -1}, lam=5)
+    assert ModelProblem(model).solve_bruteforce(all_solutions=True) == [
+        {'a': 0, 'b': 1}, {'a': 1, 'b': 0}
+    ]
+
+    assert QUBOProblem({(): 1}).solve_bruteforce() == {}
+    assert QUBOProblem({}).solve_bruteforce(all_solutions=True) == [{}]
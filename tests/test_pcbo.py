@@ -1634,3 +1634,21 @@ def test_pcbo_special_constraint_eq():
     H2 = PCBO().add_constraint_eq_zero(x * y - z)
     H3 = PCBO().add_constraint_eq_AND(z, x, y)
     assert H1 == H2 == H3
+
+
+def test_pcbo_add_constraint_OR_many():
+
+    clauses = [('a', 'b'), ('b', 'c'), ('a', 'a'), ('d',), ('a', 'c', 'd'),
+               ({('a', 'b'): 1}, 'c'), ()]
+    H = PCBO().add_constraint_OR_many(clauses, lam=3)
+    desired = PCBO()
+    for clause in clauses:
+        desired.add_constraint_OR(*clause, lam=3)
+    assert H == desired
+    assert H.constraints == desired.constraints
+
+    for i in range(1 << 4):
+        sol = dict(zip('abcd', decimal_to_boolean(i, 4)))
+        assert H.is_solution_valid(sol) == desired.is_solution_valid(sol)
+
+    assert PCBO().add_constraint_OR_many([]) == {}
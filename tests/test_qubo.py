@@ -20,10 +20,10 @@ from qubovert import QUBO
 from qubovert.utils import (
     solve_qubo_bruteforce, solve_quso_bruteforce,
     solve_pubo_bruteforce, solve_puso_bruteforce,
-    qubo_value
+    qubo_value, QUBOMatrix
 )
 from sympy import Symbol
-from numpy import allclose
+from numpy import allclose, array, int32, float64
 from numpy.testing import assert_raises
 
 
@@ -343,6 +343,23 @@ def test_convert_solution_all_1s():
     assert d.convert_solution({0: 1}, True) == {0: 0}
 
 
+def test_convert_solution_sequences():
+
+    d = QUBO({('a',): 1, ('a', 'b'): -2, ('c',): 1})
+    for sol in ([1, 1, 0], (1, 1, 0), array([1, 1, 0])):
+        assert d.convert_solution(sol) == {'a': 1, 'b': 1, 'c': 0}
+    for sol in ([-1, -1, 1], (-1, -1, 1), array([-1, -1, 1])):
+        assert d.convert_solution(sol) == {'a': 1, 'b': 1, 'c': 0}
+    assert d.convert_solution([1, 1, 1], True) == {'a': 0, 'b': 0, 'c': 0}
+    assert d.convert_solution(array([1, 1, 1]), True) == {
+        'a': 0, 'b': 0, 'c': 0
+    }
+    assert d.convert_solution(array([1, 1, 1])) == {'a': 1, 'b': 1, 'c': 1}
+    sol = d.convert_solution(array([0, 1, 1]))
+    assert sol == {'a': 0, 'b': 1, 'c': 1}
+    assert all(type(v) is int for v in sol.values())
+
+
 def test_set_mapping():
 
     d = QUBO({('a', 'b'): 1, ('a',): 2})
@@ -352,3 +369,79 @@ def test_set_mapping():
     d = QUBO({('a', 'b'): 1, ('a',): 2})
     d.set_reverse_mapping({0: 'a', 2: 'b'})
     assert d.to_qubo() == {(0, 2): 1, (0,): 2}
+    assert d.convert_solution({0: 1, 2: 0}) == {'a': 1, 'b': 0}
+
+    # the mapping does not have to be one to one
+    d = QUBO({('a', 'b'): 1, ('a',): 2})
+    d.set_mapping({'a': 0, 'b': 0})
+    Q = d.to_qubo()
+    assert Q == {(0,): 3}
+    assert Q.degree == 1 and Q.num_binary_variables == 1
+
+    d = QUBO({('a',): 1, ('b',): -1, ('c',): 2})
+    d.set_mapping({'a': 0, 'b': 0, 'c': 1})
+    assert d.to_qubo() == {(1,): 2}
+
+
+def test_to_qubo_properties():
+
+    d = QUBO({('a', 'b'): 1, ('b',): 2, (): -1})
+    d.set_mapping({'a': 3, 'b': 1})
+    Q = d.to_qubo()
+    assert Q == {(1, 3): 1, (1,): 2, (): -1}
+    assert Q.degree == 2
+    assert Q.num_binary_variables == 2
+    assert Q.max_index == 3
+    assert Q.variables == {1, 3}
+
+
+def test_to_qubo_coo():
+
+    d = QUBO({('a',): 5, (0, 'a'): -2, ('b', 0): 3, (): -1.5})
+    rows, cols, vals = d.to_qubo_coo()
+    assert rows.dtype == cols.dtype == int32
+    assert vals.dtype == float64
+    assert all(rows <= cols)
+    Q = d.to_qubo()
+    assert Q == QUBOMatrix({
+        (int(i), int(j)): v for i, j, v in zip(rows, cols, vals)
+    }) + Q.offset
+
+    rows, cols, vals = QUBO().to_qubo_coo()
+    assert len(rows) == len(cols) == len(vals) == 0
+
+    a = Symbol('a')
+    d = QUBO({('a',): a, ('a', 'b'): -2})
+    with assert_raises(TypeError):
+        d.to_qubo_coo()
+    rows, cols, vals = d.subs({a: 3}).to_qubo_coo()
+    assert allclose(vals, [3, -2])
+
+
+def test_to_qubo_identity_mapping():
+
+    d = QUBO({(0,): 1, (0, 1): -2, (2,): 3, (): 1})
+    assert d._mapping_is_identity
+    Q = d.to_qubo()
+    assert Q == {(0,): 1, (0, 1): -2, (2,): 3, (): 1}
+    assert type(Q) is QUBOMatrix
+    assert Q.degree == 2 and Q.variables == {0, 1, 2}
+    assert Q.num_binary_variables == 3
+
+    d.set_mapping({0: 1, 1: 0, 2: 2})
+    assert not d._mapping_is_identity
+    assert d.to_qubo() == {(1,): 1, (0, 1): -2, (2,): 3, (): 1}
+    d.set_reverse_mapping({0: 0, 1: 1, 2: 2})
+    assert d._mapping_is_identity
+
+    d = QUBO({(1,): 1, (0,): 2})
+    assert not d._mapping_is_identity
+    assert d.to_qubo() == {(0,): 1, (1,): 2}
+
+    d = QUBO({(0,): 1, ('a',): 2})
+    assert not d._mapping_is_identity
+    d.refresh()
+    assert not d._mapping_is_identity
+    d.clear()
+    assert d._mapping_is_identity
+    assert d.to_qubo() == {}
@@ -18,7 +18,7 @@ Contains tests for the QUBOMatrix object.
 
 from qubovert.utils import QUBOMatrix
 from sympy import Symbol
-from numpy import allclose
+from numpy import allclose, int32, float64
 from numpy.testing import assert_raises
 
 
@@ -269,3 +269,25 @@ def test_qubomatrix_solve_bruteforce():
     sols = Q.solve_bruteforce(True)
     assert sols == [{0: 0, 1: 0}, {0: 0, 1: 1}, {0: 1, 1: 1}]
     assert all(allclose(Q.value(s), 1) for s in sols)
+
+
+def test_to_qubo_coo():
+
+    Q = QUBOMatrix({(0,): 5, (1, 0): -2, (3, 1): 3, (): -1.5})
+    rows, cols, vals = Q.to_qubo_coo()
+    assert rows.dtype == cols.dtype == int32
+    assert vals.dtype == float64
+    assert rows.tolist() == [0, 0, 1]
+    assert cols.tolist() == [0, 1, 3]
+    assert vals.tolist() == [5, -2, 3]
+
+    rows, cols, vals = Q.to_qubo_coo({0: 3, 1: 2, 3: 0})
+    assert rows.tolist() == [3, 2, 0]
+    assert cols.tolist() == [3, 3, 2]
+    assert vals.tolist() == [5, -2, 3]
+
+    rows, cols, vals = QUBOMatrix().to_qubo_coo()
+    assert len(rows) == len(cols) == len(vals) == 0
+
+    with assert_raises(TypeError):
+        QUBOMatrix({(0,): Symbol('a')}).to_qubo_coo()
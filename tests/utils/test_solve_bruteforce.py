@@ -20,6 +20,8 @@ from qubovert.utils import (
     solve_qubo_bruteforce, solve_quso_bruteforce,
     solve_pubo_bruteforce, solve_puso_bruteforce
 )
+from qubovert.utils._solve_bruteforce import _solve_qubo_bruteforce_arrays
+from numpy import array
 
 
 def test_errors():
@@ -104,3 +106,24 @@ def test_solve_puso_bruteforce():
               {0: -1, 1: 1, 3: 1, 4: 1, 5: 1},
               {0: -1, 1: -1, 3: 1, 4: 1, 5: 1}])
     )
+
+
+def test_solve_qubo_bruteforce_arrays():
+
+    # -x_0 + 1e-7 (x_1 + ... + x_19), only the bitstring x_0 = 1 is a
+    # candidate even though many others are within a relative 1e-5 of it.
+    N = 20
+    rows = cols = array(range(N))
+    vals = array([-1] + [1e-7] * (N - 1))
+    assert _solve_qubo_bruteforce_arrays(rows, cols, vals, N).tolist() == [
+        1 << (N - 1)
+    ]
+
+    # large canceling coefficients, x_0 = x_1 = 0 and x_0 = x_1 = 1 both
+    # round to the minimum, so they must both be candidates.
+    rows, cols, vals = array([1, 0, 0]), array([1, 0, 1]), array([
+        1e16, .1, -1e16
+    ])
+    candidates = _solve_qubo_bruteforce_arrays(rows, cols, vals, 2).tolist()
+    assert 0 in candidates and 3 in candidates
+    assert 1 not in candidates